@@ -0,0 +1,70 @@
+"""Startup-time benchmark for the config-only CLI commands of script2.py.
+
+Runs each command in a fresh interpreter against a throwaway config and
+reports the median wall time. Exits with status 1 if any command exceeds
+the budget (200 ms by default).
+
+Usage: python benchmarks/startup_benchmark.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "script2.py")
+
+COMMANDS = [
+    ["--list-companies"],
+    ["--add-company", "Acme", "--alias", "Acme Corp", "--domain", "acme.com"],
+    ["--remove-company", "Acme"],
+    ["--interval", "15"],
+    ["--set-email", "sender@example.com", "password", "receiver@example.com"],
+]
+
+
+def time_command(args, config_path, cwd):
+    """Run one CLI invocation and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, SCRIPT, "-c", config_path] + args,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command")
+    parser.add_argument("--budget-ms", type=float, default=200, help="Maximum median time per command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        config_path = os.path.join(workdir, "config.json")
+        with open(config_path, "w") as f:
+            json.dump({"companies_to_monitor": ["Globex"]}, f)
+
+        # Baseline: bare interpreter startup, for context
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        print(f"{'python -c pass':<40} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        failed = False
+        for command in COMMANDS:
+            timings = [time_command(command, config_path, workdir) for _ in range(args.runs)]
+            median = statistics.median(timings)
+            status = "ok" if median <= args.budget_ms else "SLOW"
+            failed = failed or median > args.budget_ms
+            print(f"{' '.join(command)[:40]:<40} {median:8.1f} ms  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
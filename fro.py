@@ -1,19 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
-import json
 import os
 import threading
-from script2 import DarkWebMonitor, create_default_config
+from script2 import (get_shared_monitor, create_default_config, format_company_entry,
+                     ScanProfiler, default_profile_prefix)
 
 class DarkWebMonitorUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Dark Web Monitor")
-        self.root.geometry("600x400")
+        self.root.geometry("600x530")
         self.root.resizable(False, False)
 
         self.config_path = "config.json"
-        self.monitor = DarkWebMonitor(self.config_path)
+        self.monitor = get_shared_monitor(self.config_path)
 
         self.create_widgets()
 
@@ -37,66 +37,127 @@ class DarkWebMonitorUI:
         self.add_company_button = ttk.Button(main_frame, text="Add Company to Monitor", command=self.add_company)
         self.add_company_button.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=5)
 
+        # Remove company button
+        self.remove_company_button = ttk.Button(main_frame, text="Remove Company", command=self.remove_company)
+        self.remove_company_button.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=5)
+
         # List companies button
         self.list_companies_button = ttk.Button(main_frame, text="List Monitored Companies", command=self.list_companies)
-        self.list_companies_button.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.list_companies_button.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Set email notifications button
         self.set_email_button = ttk.Button(main_frame, text="Set Email Notifications", command=self.set_email_notifications)
-        self.set_email_button.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.set_email_button.grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Set monitoring interval button
         self.set_interval_button = ttk.Button(main_frame, text="Set Monitoring Interval", command=self.set_monitoring_interval)
-        self.set_interval_button.grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.set_interval_button.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Run test scan button
         self.test_scan_button = ttk.Button(main_frame, text="Run Test Scan", command=self.run_test_scan)
-        self.test_scan_button.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.test_scan_button.grid(row=6, column=0, columnspan=3, sticky=tk.W, pady=5)
+
+        # Profile test scans checkbox
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_check = ttk.Checkbutton(main_frame, text="Profile test scans", variable=self.profile_var)
+        self.profile_check.grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Start monitoring button
         self.start_monitoring_button = ttk.Button(main_frame, text="Start Monitoring", command=self.start_monitoring)
-        self.start_monitoring_button.grid(row=6, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.start_monitoring_button.grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Stop monitoring button
         self.stop_monitoring_button = ttk.Button(main_frame, text="Stop Monitoring", command=self.stop_monitoring, state=tk.DISABLED)
-        self.stop_monitoring_button.grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.stop_monitoring_button.grid(row=9, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         # Status label
         self.status_label = ttk.Label(main_frame, text="Status: Not Monitoring", foreground="red")
-        self.status_label.grid(row=8, column=0, columnspan=3, sticky=tk.W, pady=5)
+        self.status_label.grid(row=10, column=0, columnspan=3, sticky=tk.W, pady=5)
+
+        # Live scan progress
+        self.progress_label = ttk.Label(main_frame, text="")
+        self.progress_label.grid(row=11, column=0, columnspan=3, sticky=tk.W, pady=5)
 
         self.monitoring_thread = None
+        self.poll_progress()
+
+    def poll_progress(self):
+        # Drain the monitor's event stream without blocking the UI thread
+        self.monitor.progress.drain()
+        snapshot = self.monitor.progress.snapshot()
+        if snapshot["state"] != "idle" or snapshot["urls_done"]:
+            self.progress_label.config(text=(
+                f"{snapshot['company'] or 'Scan'} ({snapshot['state']}): "
+                f"{snapshot['urls_done']}/{snapshot['urls_total']} URLs | "
+                f"{snapshot['hits']} hits | {snapshot['errors']} errors | "
+                f"{snapshot['urls_per_second']:.1f} URLs/s"
+            ))
+
+        # Finish a requested stop once the monitoring thread has wound down
+        if self.monitoring_thread and not self.monitoring_thread.is_alive():
+            self.monitoring_thread = None
+            self.start_monitoring_button.config(state=tk.NORMAL)
+            self.stop_monitoring_button.config(state=tk.DISABLED)
+            self.status_label.config(text="Status: Not Monitoring", foreground="red")
+
+        self.root.after(500, self.poll_progress)
 
     def browse_config_file(self):
         file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if file_path:
+            # Reuse the running engine; only the settings that differ are applied
+            changed = self.monitor.reload_config(file_path)
+            if changed is None:
+                messagebox.showerror("Error", f"Error loading config: {file_path} could not be read")
+                return
+
             self.config_path = file_path
             self.config_entry.delete(0, tk.END)
             self.config_entry.insert(0, self.config_path)
-            self.monitor = DarkWebMonitor(self.config_path)
+            if changed:
+                messagebox.showinfo("Config Loaded", f"Updated settings: {', '.join(changed)}")
 
     def add_company(self):
         company = simpledialog.askstring("Add Company", "Enter the name of the company to monitor:")
         if company:
-            if company not in self.monitor.config.get("companies_to_monitor", []):
-                if "companies_to_monitor" not in self.monitor.config:
-                    self.monitor.config["companies_to_monitor"] = []
-                self.monitor.config["companies_to_monitor"].append(company)
+            aliases = simpledialog.askstring("Add Company", "Aliases (comma-separated, optional):") or ""
+            domains = simpledialog.askstring("Add Company", "Email domains (comma-separated, optional):") or ""
+            negative_keywords = simpledialog.askstring(
+                "Add Company", "Negative keywords (comma-separated, optional):") or ""
+
+            # The watchlist is updated in place, so a running monitor picks it up
+            self.monitor.add_company(
+                company,
+                aliases=aliases.split(","),
+                domains=domains.split(","),
+                negative_keywords=negative_keywords.split(",")
+            )
+
+            # Save updated config
+            try:
+                self.monitor.save_config(keys=["companies_to_monitor"])
+                messagebox.showinfo("Success", f"Added {company} to monitored companies")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error saving config: {e}")
 
-                # Save updated config
+    def remove_company(self):
+        company = simpledialog.askstring("Remove Company", "Enter the name of the company to stop monitoring:")
+        if company:
+            if self.monitor.remove_company(company):
                 try:
-                    with open(self.config_path, "w") as f:
-                        json.dump(self.monitor.config, f, indent=2)
-                    messagebox.showinfo("Success", f"Added {company} to monitored companies")
+                    self.monitor.save_config(keys=["companies_to_monitor"])
+                    messagebox.showinfo("Success", f"Removed {company} from monitored companies")
                 except Exception as e:
                     messagebox.showerror("Error", f"Error saving config: {e}")
             else:
-                messagebox.showinfo("Info", f"{company} is already being monitored")
+                messagebox.showinfo("Info", f"{company} is not being monitored")
 
     def list_companies(self):
-        companies = self.monitor.config.get("companies_to_monitor", [])
+        companies = self.monitor.watchlist.names()
         if companies:
-            companies_list = "\n".join(companies)
+            companies_list = "\n".join(
+                format_company_entry(self.monitor.watchlist.get(company)) for company in companies
+            )
             messagebox.showinfo("Monitored Companies", f"Currently monitoring these companies:\n{companies_list}")
         else:
             messagebox.showinfo("Monitored Companies", "No companies configured for monitoring")
@@ -107,14 +168,13 @@ class DarkWebMonitorUI:
         receiver_email = simpledialog.askstring("Email Notifications", "Enter receiver email:")
 
         if sender_email and email_password and receiver_email:
-            self.monitor.config["email_notifications"] = True
-            self.monitor.config["sender_email"] = sender_email
-            self.monitor.config["email_password"] = email_password
-            self.monitor.config["receiver_email"] = receiver_email
-
             try:
-                with open(self.config_path, "w") as f:
-                    json.dump(self.monitor.config, f, indent=2)
+                self.monitor.update_config({
+                    "email_notifications": True,
+                    "sender_email": sender_email,
+                    "email_password": email_password,
+                    "receiver_email": receiver_email
+                })
                 messagebox.showinfo("Success", "Email notification settings updated")
             except Exception as e:
                 messagebox.showerror("Error", f"Error saving config: {e}")
@@ -122,23 +182,47 @@ class DarkWebMonitorUI:
     def set_monitoring_interval(self):
         interval = simpledialog.askinteger("Monitoring Interval", "Enter monitoring interval in minutes:")
         if interval:
-            self.monitor.config["monitoring_interval_minutes"] = interval
             try:
-                with open(self.config_path, "w") as f:
-                    json.dump(self.monitor.config, f, indent=2)
+                self.monitor.update_config({"monitoring_interval_minutes": interval})
                 messagebox.showinfo("Success", f"Monitoring interval set to {interval} minutes")
             except Exception as e:
                 messagebox.showerror("Error", f"Error saving config: {e}")
 
     def run_test_scan(self):
+        # Scans share the engine's stop event and progress counters; run one at a time
+        if self.monitor.is_scanning():
+            messagebox.showwarning("Test Scan", "A scan is already running. Wait for it to finish or stop it first.")
+            return
         company = simpledialog.askstring("Test Scan", "Enter the name of the company to test scan:")
         if company:
-            threading.Thread(target=self.monitor.monitor_company, args=(company,)).start()
+            threading.Thread(target=self.test_scan, args=(company, self.profile_var.get()), daemon=True).start()
             messagebox.showinfo("Test Scan", f"Running test scan for {company}...")
 
+    def test_scan(self, company, profile):
+        profiler = None
+        if profile:
+            try:
+                profiler = ScanProfiler().instrument(self.monitor)
+            except RuntimeError as e:
+                message = str(e)
+                self.root.after(0, lambda: messagebox.showwarning("Profile", message))
+                return
+        try:
+            self.monitor.monitor_company(company)
+        finally:
+            if profiler:
+                profiler.restore()
+                report_file, folded_file = profiler.write(default_profile_prefix())
+                # Tk is not thread-safe; show the result from the UI thread
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Profile", f"Profile for {company} written to:\n{report_file}\n{folded_file}"))
+
     def start_monitoring(self):
         if not self.monitoring_thread or not self.monitoring_thread.is_alive():
-            self.monitoring_thread = threading.Thread(target=self.monitor.run_monitoring)
+            if self.monitor.is_scanning():
+                messagebox.showwarning("Monitoring", "A test scan is still running. Start monitoring once it has finished.")
+                return
+            self.monitoring_thread = threading.Thread(target=self.monitor.run_monitoring, daemon=True)
             self.monitoring_thread.start()
             self.start_monitoring_button.config(state=tk.DISABLED)
             self.stop_monitoring_button.config(state=tk.NORMAL)
@@ -147,13 +231,10 @@ class DarkWebMonitorUI:
 
     def stop_monitoring(self):
         if self.monitoring_thread and self.monitoring_thread.is_alive():
-            # This is a simplified way to stop the thread. In a real application, you should use a more robust method.
-            self.monitor.stop_monitoring = True
-            self.monitoring_thread.join()
-            self.start_monitoring_button.config(state=tk.NORMAL)
+            # Cooperative cancellation; poll_progress re-enables the buttons once the thread exits
+            self.monitor.request_stop()
             self.stop_monitoring_button.config(state=tk.DISABLED)
-            self.status_label.config(text="Status: Not Monitoring", foreground="red")
-            messagebox.showinfo("Monitoring", "Monitoring stopped")
+            self.status_label.config(text="Status: Stopping...", foreground="orange")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,24 +1,23 @@
-import requests
-from bs4 import BeautifulSoup
-import socks
 import socket
-import smtplib
 import re
 import time
-import schedule
-import spacy
 import argparse
 import json
 import logging
 import os
 import csv
 import concurrent.futures
+import threading
+import queue
 import hashlib
+import zlib
+from collections import Counter
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from tqdm import tqdm
-from cryptography.fernet import Fernet
+from itertools import chain
+from urllib.parse import quote_plus
+
+# Third-party modules (requests, bs4, socks, spacy, cryptography, schedule, tqdm)
+# are imported where they are used, so config-only commands start instantly.
 
 # Configure logging
 logging.basicConfig(
@@ -31,33 +30,459 @@ logging.basicConfig(
 )
 logger = logging.getLogger("darkweb_monitor")
 
-class DarkWebMonitor:
-    def __init__(self, config_path=None):
-        """Initialize the Dark Web Monitor with optional configuration file."""
-        # Load Spacy NER Model
+# Keywords that suggest a page contains leaked or sensitive data
+LEAK_INDICATORS = [
+    "password", "email", "leaked data", "database dump", 
+    "breach", "exposed", "credentials", "dump", "sensitive",
+    "personal data", "credit card", "financial"
+]
+LEAK_INDICATOR_PATTERN = re.compile(
+    "|".join(re.escape(indicator) for indicator in LEAK_INDICATORS),
+    re.IGNORECASE
+)
+
+# Credential dump fast path: chunk size for streamed pages and per-format patterns
+DUMP_CHUNK_SIZE = 1024 * 1024
+DUMP_SNIFF_BYTES = 64 * 1024
+COMBO_LINE_PATTERN = re.compile(r'^[^\s@:;|]+@[^\s@:;|,]+\.[A-Za-z]{2,}[:;|]\S', re.MULTILINE)
+EMAIL_DOMAIN_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+SQL_INSERT_PATTERN = re.compile(r'\bINSERT\s+INTO\b', re.IGNORECASE)
+DUMP_MAX_CARRY = 1024 * 1024
+# Literal first (no leading \b) so re can skip ahead with a fast substring search
+DUMP_INSERT_PATTERN = re.compile(rb'insert(?<!\winsert)\s+into\b')
+DUMP_LOCAL_PART_PATTERN = re.compile(rb'[A-Za-z0-9._%+-]+$')
+EMAIL_FIELD_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+# Combo and CSV lines hold one account: capture its domain, anchored at the line
+# start so a password that contains a domain is never counted
+DUMP_ACCOUNT_PATTERNS = {
+    "combo": rb'\n[^\s@:;|]*@([a-z0-9.-]+)[:;|]',
+    "csv": rb'\n(?:[^,\n]*,){%d}"?[^\s@,"]*@([a-z0-9.-]+)"?(?![^,\n])'
+}
+# SQL rows can hold several emails: match a company's domain and consume the rest
+# of the row so it is counted once
+SQL_RECORD_PATTERN = rb'@(%b)(?![a-z0-9.-])[^)]*(?:\)(?!\s*,\s*\(|\s*;)[^)]*)*'
+DUMP_RECORD_SEPARATORS = {
+    "sql": (b"),(", b";", b"\n"),
+    "combo": (b"\n",),
+    "csv": (b"\n",)
+}
+
+# Change detection: pages are split into content-defined blocks of at most this size
+PAGE_BLOCK_MAX_CHARS = 4096
+
+class CompanyWatchlist:
+    """Watched companies with aliases, email domains and negative keywords.
+    
+    All names, aliases and domains are compiled into one trie-shaped regex so a
+    page is matched against every company in a single pass, no matter how many
+    thousands of entries are watched. The index is rebuilt lazily after edits,
+    so companies can be added or removed while the monitor is running.
+    """
+
+    def __init__(self, entries=None):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._index = None
+        for entry in entries or []:
+            if isinstance(entry, str):
+                self.add(entry)
+            else:
+                self.add(
+                    entry["name"],
+                    aliases=entry.get("aliases"),
+                    domains=entry.get("domains"),
+                    negative_keywords=entry.get("negative_keywords")
+                )
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def names(self):
+        """Return the watched company names in insertion order."""
+        return list(self._entries)
+
+    def get(self, name):
+        """Return the entry for a company, or None."""
+        return self._entries.get(name)
+
+    def add(self, name, aliases=None, domains=None, negative_keywords=None):
+        """Add a company, or merge new aliases/domains/negative keywords into it."""
+        with self._lock:
+            entry = self._entries.setdefault(name, {
+                "name": name, "aliases": [], "domains": [], "negative_keywords": []
+            })
+            for key, values in (("aliases", aliases), ("domains", domains),
+                                ("negative_keywords", negative_keywords)):
+                for value in values or []:
+                    value = value.strip()
+                    if key == "domains":
+                        value = value.lower().lstrip("@.")
+                    if value and value not in entry[key]:
+                        entry[key].append(value)
+            self._index = None
+        return entry
+
+    def remove(self, name):
+        """Stop watching a company. Returns False if it was not watched."""
+        with self._lock:
+            if self._entries.pop(name, None) is None:
+                return False
+            self._index = None
+        return True
+
+    def sync(self, entries):
+        """Replace the watched companies with config entries, keeping unchanged ones.
+        
+        Returns (added, removed) name lists. The index is only invalidated if
+        something actually changed.
+        """
+        updated = CompanyWatchlist(entries)._entries
+        with self._lock:
+            added = [name for name in updated if name not in self._entries]
+            removed = [name for name in self._entries if name not in updated]
+            if updated != self._entries:
+                self._entries = updated
+                self._index = None
+        return added, removed
+
+    def to_config(self):
+        """Serialise entries for the config file, keeping plain names as strings."""
+        return [
+            entry["name"] if not any(entry[key] for key in ("aliases", "domains", "negative_keywords"))
+            else dict(entry)
+            for entry in self._entries.values()
+        ]
+
+    def _get_index(self):
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._build_index()
+                index = self._index
+        return index
+
+    def _build_index(self):
+        terms = {}
+        negatives = {}
+        domains = {}
+        labels = {}
+        for name, entry in self._entries.items():
+            for term in [name] + entry["aliases"] + entry["domains"]:
+                terms.setdefault(term.lower(), set()).add(name)
+            for keyword in entry["negative_keywords"]:
+                negatives.setdefault(keyword.lower(), set()).add(name)
+            for domain in entry["domains"]:
+                domains.setdefault(domain, set()).add(name)
+            if not entry["domains"]:
+                labels.setdefault(re.sub(r'[^a-z0-9-]', '', name.lower()), set()).add(name)
+        return {
+            "pattern": _compile_term_pattern(terms),
+            "terms": terms,
+            "nested": _find_nested_terms(terms),
+            "negative_pattern": _compile_term_pattern(negatives),
+            "negatives": negatives,
+            "nested_negatives": _find_nested_terms(negatives),
+            "domains": domains,
+            "labels": labels
+        }
+
+    def match(self, text):
+        """Match a page against every watched company in one pass.
+        
+        Returns {company: [(start, end), ...]} with the offsets of each name,
+        alias or domain mention. Companies whose negative keywords appear in
+        the text are dropped.
+        """
+        index = self._get_index()
+        if index["pattern"] is None:
+            return {}
+        
+        matches = {}
+        for match in index["pattern"].finditer(text):
+            # The regex keeps the longest term; also credit the terms nested in it
+            credited = set()
+            for start, end, term in _iter_match_terms(match, index["nested"]):
+                for name in index["terms"].get(term, ()):
+                    if name not in credited:
+                        credited.add(name)
+                        matches.setdefault(name, []).append((start, end))
+        
+        if matches and index["negative_pattern"] is not None:
+            for match in index["negative_pattern"].finditer(text):
+                for _, _, term in _iter_match_terms(match, index["nested_negatives"]):
+                    for name in index["negatives"].get(term, ()):
+                        matches.pop(name, None)
+                if not matches:
+                    break
+        return matches
+
+    def companies_for_domain(self, domain):
+        """Return the companies an email domain belongs to, including subdomains.
+        
+        Companies without configured domains match any domain whose
+        second-level label is the company name (acme.com, mail.acme.co.uk).
+        """
+        index = self._get_index()
+        domain = domain.lower()
+        companies = set()
+        parts = domain.split(".")
+        for i in range(len(parts) - 1):
+            companies.update(index["domains"].get(".".join(parts[i:]), ()))
+        if index["labels"] and len(parts) >= 2:
+            companies.update(index["labels"].get(parts[-2], ()))
+            if len(parts) >= 3 and len(parts[-2]) <= 3:
+                companies.update(index["labels"].get(parts[-3], ()))
+        return companies
+
+
+def _compile_domain_pattern(watchlist, company):
+    """Compile a bytes regex matching one SQL row per email of a company.
+    
+    The pattern is meant for lowercased input (bytes.lower() is much cheaper
+    than re.IGNORECASE) and captures the domain.
+    """
+    entry = watchlist.get(company)
+    if entry is None:
+        return None
+    if entry["domains"]:
+        alternatives = {re.escape(domain.lower().encode()) for domain in entry["domains"]}
+    else:
+        label = re.sub(r'[^a-z0-9-]', '', company.lower()).encode()
+        if not label:
+            return None
+        alternatives = {re.escape(label) + rb'(?:\.[a-z]{2,3})?\.[a-z]{2,}'}
+    
+    domain = rb'(?:[a-z0-9-]+\.)*?(?:' + b"|".join(sorted(alternatives, key=len, reverse=True)) + rb')'
+    return re.compile(SQL_RECORD_PATTERN % domain)
+
+
+def _find_nested_terms(terms):
+    """Map each term to the other terms found inside it on word boundaries.
+    
+    A trie regex only reports the longest term at a position, so "acme corp"
+    would hide "acme" and "globex bank ltd" would hide "bank ltd". Returns
+    {term: [(start, end, nested_term), ...]}, longest first, for the terms that
+    contain others.
+    """
+    nested = {}
+    for term in terms:
+        starts = [0] + [match.end() for match in re.finditer(r'\W', term)]
+        ends = [match.start() for match in re.finditer(r'\W', term)] + [len(term)]
+        found = [
+            (start, end, term[start:end]) for start in starts for end in ends
+            if start < end and (start, end) != (0, len(term)) and term[start:end] in terms
+        ]
+        if found:
+            nested[term] = sorted(found, key=lambda item: item[0] - item[1])
+    return nested
+
+
+def _iter_match_terms(match, nested):
+    """Yield (start, end, term) for a trie regex match and the terms nested in it."""
+    term = match.group(0).lower()
+    offset = match.start()
+    yield match.start(), match.end(), term
+    for start, end, nested_term in nested.get(term, ()):
+        yield offset + start, offset + end, nested_term
+
+
+def _compile_term_pattern(terms):
+    """Compile lowercase terms into a single case-insensitive trie regex."""
+    if not terms:
+        return None
+    
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return re.compile(rf'(?<!\w){build(trie)}(?!\w)', re.IGNORECASE)
+
+
+class ScanProgress:
+    """Thread-safe scan counters plus a bounded event queue.
+    
+    Scans emit events from worker threads; the Tk UI polls drain() and
+    snapshot() without blocking and the CLI renders the same stream. When
+    the queue is full new events are dropped, but the counters stay exact.
+    """
+
+    def __init__(self, max_events=10000):
+        self._events = queue.Queue(maxsize=max_events)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero the counters at the start of a scan."""
+        with self._lock:
+            self._counters = {
+                "state": "idle",
+                "company": None,
+                "urls_total": 0,
+                "urls_done": 0,
+                "hits": 0,
+                "errors": 0,
+                "started_at": time.monotonic()
+            }
+
+    def emit(self, event_type, **data):
+        """Record an event and update the counters it affects."""
+        with self._lock:
+            counters = self._counters
+            if event_type in ("cycle_started", "company_started"):
+                counters["state"] = "running"
+                counters["company"] = data.get("company", counters["company"])
+            elif event_type == "fetch_started":
+                counters["urls_total"] += data.get("total", 0)
+            elif event_type == "url_done":
+                counters["urls_done"] += 1
+            elif event_type == "hit":
+                counters["hits"] += 1
+            elif event_type == "error":
+                counters["errors"] += 1
+            elif event_type == "stop_requested":
+                counters["state"] = "stopping"
+            elif event_type in ("cycle_done", "cancelled"):
+                counters["state"] = "cancelled" if event_type == "cancelled" else "idle"
+        
+        event = dict(data, type=event_type, time=time.time())
         try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("NLP engine loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load NLP engine: {e}")
-            logger.info("Downloading NLP model...")
-            spacy.cli.download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+            self._events.put_nowait(event)
+        except queue.Full:
+            pass
+
+    def drain(self, max_events=None):
+        """Return pending events without blocking."""
+        events = []
+        while max_events is None or len(events) < max_events:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def snapshot(self):
+        """Return a copy of the counters with elapsed time and throughput."""
+        with self._lock:
+            counters = dict(self._counters)
+        elapsed = time.monotonic() - counters.pop("started_at")
+        counters["elapsed_seconds"] = elapsed
+        counters["urls_per_second"] = counters["urls_done"] / elapsed if elapsed > 0 else 0.0
+        return counters
+
+
+class DarkWebMonitor:
+    def __init__(self, config_path=None, connect=True):
+        """Initialize the Dark Web Monitor with optional configuration file.
+        
+        The NLP model and encryption key are loaded on first use. With
+        connect=False the Tor proxy is not configured, which is all that
+        config-only commands need.
+        """
+        self._nlp = None
+        self._cipher = None
+        self._resource_lock = threading.Lock()
+        self._tor_lock = threading.Lock()
+        self._tor_status = {"working": None, "checked_at": None}
+        self._tor_probe = None
+        self._session = None
+        self._connected = connect
+        self._config_mtime = None
+        self._stop_event = threading.Event()
+        self._scan_lock = threading.Lock()
+        self._profiler = None
+        self._page_state = None
+        self._page_state_dirty = False
+        self._page_state_generation = 0
+        self._pending_page_state = {}
+        self._pending_pages = {}
+        self._page_state_lock = threading.Lock()
+        self.progress = ScanProgress()
         
         # Load configuration
+        self.config_path = config_path
         self.config = self.load_config(config_path)
+        self.watchlist = CompanyWatchlist(self.config.get("companies_to_monitor", []))
         
         # Setup Tor connection
-        self.setup_tor()
-        
-        # Create encryption key if it doesn't exist
-        self.setup_encryption()
+        if connect:
+            self.setup_tor()
         
         # Create directories if they don't exist
         self.create_directories()
 
-    def load_config(self, config_path):
-        """Load configuration from file or use defaults."""
+    @property
+    def nlp(self):
+        """Spacy NER model, loaded on first use."""
+        if self._nlp is None:
+            with self._resource_lock:
+                if self._nlp is None:
+                    self._nlp = self.load_nlp()
+        return self._nlp
+
+    @property
+    def session(self):
+        """Shared HTTP session whose connection pool is reused across requests."""
+        if self._session is None:
+            with self._resource_lock:
+                if self._session is None:
+                    self._session = self.create_session()
+        return self._session
+
+    def create_session(self):
+        """Create an HTTP session sized for the configured concurrency."""
+        import requests
+        
+        pool_size = self.config.get("max_concurrent_requests", 5)
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def cipher(self):
+        """Fernet cipher for leak data, set up on first use."""
+        if self._cipher is None:
+            with self._resource_lock:
+                if self._cipher is None:
+                    self._cipher = self.setup_encryption()
+        return self._cipher
+
+    def load_nlp(self):
+        """Load the Spacy NER model, downloading it if necessary."""
+        import spacy
+        
+        try:
+            nlp = spacy.load("en_core_web_sm")
+            logger.info("NLP engine loaded successfully")
+        except Exception as e:
+            logger.error(f"Failed to load NLP engine: {e}")
+            logger.info("Downloading NLP model...")
+            spacy.cli.download("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm")
+        return nlp
+
+    def load_config(self, config_path, strict=False):
+        """Load configuration from file or use defaults.
+        
+        With strict=True a file that is missing or cannot be parsed (for
+        example because it is still being written) returns None instead of
+        the defaults.
+        """
         default_config = {
             "tor_proxy_host": "127.0.0.1",
             "tor_proxy_port": 9050,
@@ -77,9 +502,24 @@ class DarkWebMonitor:
                 "company hacked", "data exposed", "credential leak",
                 "customer data", "credit card dump", "sensitive information"
             ],
+            # Per-engine query features used by the query planner; engines not
+            # listed get one query per term and no pagination
+            "search_engine_capabilities": {
+                "https://ahmia.fi/search/?q=": {
+                    "or_operator": "OR", "max_terms": 5, "page_param": "&page=", "max_pages": 3
+                },
+                "https://darksearch.io/search?query=": {
+                    "or_operator": "OR", "max_terms": 5, "page_param": "&page=", "max_pages": 3
+                }
+            },
             "monitoring_interval_minutes": 30,
             "request_timeout": 25,
+            "tor_check_ttl_minutes": 10,
             "max_concurrent_requests": 5,
+            "snippet_context_chars": 200,
+            "max_snippet_chars": 2000,
+            "max_snippets": 5,
+            "dump_sample_size": 10,
             "user_agents": [
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.2 Safari/605.1.15",
@@ -98,6 +538,7 @@ class DarkWebMonitor:
         
         if config_path and os.path.exists(config_path):
             try:
+                self._config_mtime = os.path.getmtime(config_path)
                 with open(config_path, 'r') as f:
                     user_config = json.load(f)
                     # Merge user config with defaults
@@ -106,12 +547,19 @@ class DarkWebMonitor:
                 logger.info(f"Configuration loaded from {config_path}")
             except Exception as e:
                 logger.error(f"Error loading configuration: {e}")
+                if strict:
+                    return None
+        elif strict:
+            logger.error(f"Configuration file {config_path} not found")
+            return None
         
         return default_config
 
     def setup_tor(self):
-        """Configure Tor proxy connection."""
+        """Configure Tor proxy connection and start a background health probe."""
         try:
+            import socks
+            
             socks.set_default_proxy(
                 socks.SOCKS5, 
                 self.config["tor_proxy_host"], 
@@ -119,20 +567,51 @@ class DarkWebMonitor:
             )
             socket.socket = socks.socksocket
             logger.info("Tor proxy configured successfully")
-            
-            # Test Tor connection
+        except Exception as e:
+            logger.error(f"Failed to configure Tor: {e}")
+            logger.warning("Continuing without Tor. Some .onion sites will be inaccessible")
+            return
+        
+        self.check_tor_connection()
+
+    def check_tor_connection(self):
+        """Return the cached Tor health status, refreshing it in the background.
+        
+        The probe never blocks the caller: if the cached result is older than
+        tor_check_ttl_minutes a daemon thread re-tests the connection. Returns
+        True/False, or None while the first probe is still running.
+        """
+        with self._tor_lock:
+            status = self._tor_status
+            ttl = self.config.get("tor_check_ttl_minutes", 10) * 60
+            fresh = status["checked_at"] is not None and time.monotonic() - status["checked_at"] < ttl
+            if not fresh and (self._tor_probe is None or not self._tor_probe.is_alive()):
+                self._tor_probe = threading.Thread(target=self._probe_tor, name="tor-probe", daemon=True)
+                self._tor_probe.start()
+            return status["working"]
+
+    def _probe_tor(self):
+        """Test the Tor connection and cache the result."""
+        try:
             test_url = "https://check.torproject.org/"
-            response = requests.get(test_url, timeout=self.config["request_timeout"])
-            if "Congratulations" in response.text:
+            response = self.session.get(test_url, timeout=self.config["request_timeout"])
+            working = "Congratulations" in response.text
+            if working:
                 logger.info("Tor connection confirmed and working properly")
             else:
                 logger.warning("Tor connection may not be working properly")
         except Exception as e:
-            logger.error(f"Failed to configure Tor: {e}")
+            working = False
+            logger.error(f"Tor connection check failed: {e}")
             logger.warning("Continuing without Tor. Some .onion sites will be inaccessible")
+        
+        with self._tor_lock:
+            self._tor_status = {"working": working, "checked_at": time.monotonic()}
 
     def setup_encryption(self):
         """Setup encryption for sensitive data storage."""
+        from cryptography.fernet import Fernet
+        
         key_file = "encryption.key"
         if not os.path.exists(key_file):
             key = Fernet.generate_key()
@@ -143,8 +622,8 @@ class DarkWebMonitor:
             with open(key_file, "rb") as f:
                 key = f.read()
         
-        self.cipher = Fernet(key)
         logger.info("Encryption setup complete")
+        return Fernet(key)
 
     def create_directories(self):
         """Create necessary directories for data storage."""
@@ -153,20 +632,52 @@ class DarkWebMonitor:
             os.makedirs(dir_name, exist_ok=True)
         logger.info("Created necessary directories")
 
+    def request_stop(self):
+        """Ask running scans to stop at the next cancellation point."""
+        self._stop_event.set()
+        self.progress.emit("stop_requested")
+        logger.info("Stop requested; cancelling in-flight scans")
+
+    def is_scanning(self):
+        """Return True while a scan or monitoring cycle is running."""
+        return self._scan_lock.locked()
+
+    def is_stopping(self):
+        """Return True once a stop has been requested for the current scan."""
+        return self._stop_event.is_set()
+
+    def iter_until_stopped(self, chunks):
+        """Yield response chunks until a stop is requested."""
+        for chunk in chunks:
+            if self._stop_event.is_set():
+                return
+            yield chunk
+
     def get_random_user_agent(self):
         """Return a random user agent from the config."""
         import random
         return random.choice(self.config["user_agents"])
 
-    def search_for_leaks(self, engine_url, keyword, company):
-        """Search a specific search engine for leaked data URLs."""
+    def search_for_leaks(self, engine_url, keyword, company, page=1):
+        """Search a specific search engine for leaked data URLs.
+        
+        keyword may be a single term or an OR group built by the query planner.
+        """
+        import requests
+        from bs4 import BeautifulSoup
+        
         search_query = f"{keyword} {company}"
-        logger.debug(f"Searching {engine_url} for: {search_query}")
+        logger.debug(f"Searching {engine_url} for: {search_query} (page {page})")
+        
+        search_url = engine_url + quote_plus(search_query)
+        if page > 1:
+            page_param = self.get_engine_capabilities(engine_url).get("page_param", "")
+            search_url += f"{page_param}{page}"
         
         try:
             headers = {"User-Agent": self.get_random_user_agent()}
-            response = requests.get(
-                engine_url + search_query, 
+            response = self.session.get(
+                search_url, 
                 headers=headers, 
                 timeout=self.config["request_timeout"]
             )
@@ -184,64 +695,236 @@ class DarkWebMonitor:
             return urls
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error when searching {engine_url}: {e}")
+            self.progress.emit("error", url=search_url, error=str(e))
             return []
         except Exception as e:
             logger.error(f"Error searching {engine_url}: {e}")
+            self.progress.emit("error", url=search_url, error=str(e))
             return []
 
-    def scrape_site_for_leaks(self, url, company):
-        """Scrape a site for sensitive data related to the company."""
+    def scrape_site_for_leaks(self, url, companies, watchlist=None, generation=None):
+        """Fetch a page once and check it for leaks of every given company.
+        
+        The page is matched against the watchlist in a single pass; each
+        company then only considers its mentions in the regions that changed
+        since it last analysed the page. generation is the page-state
+        generation of the scan this fetch belongs to. Returns {company: leak}
+        for the companies with new leaks.
+        """
+        import requests
+        
         logger.debug(f"Scraping: {url}")
         
+        if self.is_stopping():
+            return {}
+        watchlist = watchlist or self.get_watchlist_for(companies)
+        
         try:
             headers = {"User-Agent": self.get_random_user_agent()}
-            response = requests.get(
+            response = self.session.get(
                 url, 
                 headers=headers, 
-                timeout=self.config["request_timeout"]
+                timeout=self.config["request_timeout"],
+                stream=True
             )
             
             if response.status_code != 200:
-                return None
+                response.close()
+                return {}
+            
+            # Sniff the first chunk; structured credential dumps skip the generic path
+            encoding = response.encoding or "utf-8"
+            chunks = self.iter_until_stopped(response.iter_content(chunk_size=DUMP_CHUNK_SIZE))
+            first_chunk = next(chunks, b"")
+            dump_format = sniff_dump_format(
+                first_chunk[:DUMP_SNIFF_BYTES].decode(encoding, errors="replace")
+            )
+            if dump_format:
+                try:
+                    return self.scan_dump_for_leaks(
+                        url, companies, dump_format, chain([first_chunk], chunks), watchlist, generation
+                    )
+                finally:
+                    # Release the pooled connection even if the scan stopped part-way
+                    response.close()
                 
-            text = response.text.lower()
-            company_lower = company.lower()
+            text = (first_chunk + b"".join(chunks)).decode(encoding, errors="replace")
+            if self.is_stopping():
+                response.close()
+                return {}
             
-            # Check if the company name appears in the text
-            if company_lower not in text:
-                return None
+            # Calculate content hash to avoid duplicates
+            content_hash = hashlib.md5(text.encode()).hexdigest()
+            
+            leaks = {}
+            blocks = None
+            analysed = {}
+            for company in companies:
+                # Only analyse the regions that changed since this page was last analysed
+                previous = self.get_page_state(company, url)
+                if previous and previous.get("content_hash") == content_hash:
+                    continue
                 
-            # Check for sensitive data leak indicators
-            leak_indicators = [
-                "password", "email", "leaked data", "database dump", 
-                "breach", "exposed", "credentials", "dump", "sensitive",
-                "personal data", "credit card", "financial"
-            ]
-            
-            if any(indicator in text for indicator in leak_indicators):
-                # Calculate content hash to avoid duplicates
-                content_hash = hashlib.md5(text.encode()).hexdigest()
+                if blocks is None:
+                    blocks = split_content_blocks(text)
+                    block_hashes = [
+                        hashlib.blake2b(text[start:end].encode(errors="replace"), digest_size=8).hexdigest()
+                        for start, end in blocks
+                    ]
+                    state = {
+                        "content_hash": content_hash,
+                        "block_hashes": sorted(set(block_hashes)),
+                        "analysed_at": datetime.now().isoformat()
+                    }
+                self.set_pending_page_state(company, url, state, generation)
                 
-                # Extract relevant text snippets
-                relevant_snippets = []
-                paragraphs = re.split(r'\n+', text)
-                for para in paragraphs:
-                    if company_lower in para and any(indicator in para for indicator in leak_indicators):
-                        relevant_snippets.append(para)
+                # Companies that last saw the same page version share one watchlist pass
+                # over the regions that are new to them
+                baseline = previous.get("content_hash") if previous else None
+                if baseline not in analysed:
+                    new_text, new_regions = text, len(blocks)
+                    if previous:
+                        known = set(previous.get("block_hashes", []))
+                        new_blocks = [block for block, block_hash in zip(blocks, block_hashes) if block_hash not in known]
+                        new_regions = len(new_blocks)
+                        new_text = "\n".join(text[start:end] for start, end in merge_adjacent_blocks(new_blocks))
+                    
+                    # Check for sensitive data leak indicators before matching company names
+                    matches = watchlist.match(new_text) if LEAK_INDICATOR_PATTERN.search(new_text) else {}
+                    analysed[baseline] = (new_text, new_regions, matches)
+                new_text, new_regions, matches = analysed[baseline]
+                
+                # Check if the company (or one of its aliases/domains) appears in the new text
+                company_spans = matches.get(company)
+                if not company_spans:
+                    continue
                 
-                return {
+                # Extract relevant text snippets around each match
+                leaks[company] = {
                     "url": url,
                     "content_hash": content_hash,
                     "discovery_time": datetime.now().isoformat(),
-                    "relevant_snippets": relevant_snippets[:5]  # Limit to 5 snippets
+                    "relevant_snippets": self.extract_snippets(new_text, company_spans),
+                    "changed_since": previous.get("analysed_at") if previous else None,
+                    "new_regions": new_regions
                 }
-        except requests.exceptions.RequestException:
-            return None
+            return leaks
+        except requests.exceptions.RequestException as e:
+            self.progress.emit("error", url=url, error=str(e))
+            return {}
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
-            return None
+            self.progress.emit("error", url=url, error=str(e))
+            return {}
+
+    def get_watchlist_for(self, companies):
+        """Return a watchlist covering the companies being scanned.
+        
+        A multi-company scan shares the full watchlist; a single company (or
+        one that is not watched) gets a small index of its own so a one-off
+        scan does not match every watched name.
+        """
+        if len(companies) > 1 and all(company in self.watchlist for company in companies):
+            return self.watchlist
+        return CompanyWatchlist([self.watchlist.get(company) or company for company in companies])
+
+    def scan_dump_for_leaks(self, url, companies, dump_format, chunks, watchlist=None, generation=None):
+        """Count records in a credential dump that belong to the companies' email domains.
+        
+        The dump is streamed once for all companies. Returns {company: leak}
+        for the companies with records added since the dump was last analysed.
+        """
+        stats = scan_credential_dump(
+            chunks,
+            dump_format,
+            watchlist or self.get_watchlist_for(companies),
+            companies,
+            sample_size=self.config.get("dump_sample_size", 10)
+        )
+        if self.is_stopping():
+            return {}
+        
+        logger.info(
+            f"Scanned {dump_format} dump at {url}: {stats['total_records']} records, "
+            + ", ".join(f"{stats['companies'][company]['matched_records']} matching {company}"
+                        for company in companies)
+        )
+        
+        leaks = {}
+        for company in companies:
+            company_stats = stats["companies"][company]
             
-        return None
+            # Only alert on records added since the dump was last analysed
+            previous = self.get_page_state(company, url)
+            previous_matched = previous.get("matched_records", 0) if previous else 0
+            if previous and previous.get("content_hash") == stats["content_hash"]:
+                continue
+            self.set_pending_page_state(company, url, {
+                "content_hash": stats["content_hash"],
+                "matched_records": company_stats["matched_records"],
+                "analysed_at": datetime.now().isoformat()
+            }, generation)
+            
+            new_matched = company_stats["matched_records"] - previous_matched
+            if new_matched <= 0:
+                continue
+            
+            leaks[company] = {
+                "url": url,
+                "content_hash": stats["content_hash"],
+                "discovery_time": datetime.now().isoformat(),
+                "relevant_snippets": [
+                    f"{dump_format} dump: {company_stats['matched_records']} of {stats['total_records']} "
+                    f"records match {company} email domains ({new_matched} new)"
+                ],
+                "changed_since": previous.get("analysed_at") if previous else None,
+                "dump_stats": {
+                    "format": dump_format,
+                    "bytes_scanned": stats["bytes_scanned"],
+                    "total_records": stats["total_records"],
+                    "matched_records": company_stats["matched_records"],
+                    "new_matched_records": new_matched,
+                    "matched_domains": company_stats["matched_domains"],
+                    "sample": company_stats["sample"]
+                }
+            }
+        return leaks
+
+    def extract_snippets(self, text, company_spans):
+        """Cut fixed-size context windows around company/leak indicator co-occurrences.
+        
+        Windows are driven by match offsets rather than paragraph boundaries, so a
+        page without newlines cannot produce an unbounded snippet. Overlapping
+        windows are merged (up to max_snippet_chars) and the original casing is kept.
+        """
+        context = self.config.get("snippet_context_chars", 200)
+        max_snippets = self.config.get("max_snippets", 5)
+        max_chars = self.config.get("max_snippet_chars", 2000)
+        
+        windows = []
+        for match_start, match_end in sorted(company_spans):
+            start = max(0, match_start - context)
+            end = min(len(text), match_end + context)
+            
+            # Only keep windows where a leak indicator occurs near the company name
+            if not LEAK_INDICATOR_PATTERN.search(text, start, end):
+                continue
+            
+            if windows and start <= windows[-1][1] and end - windows[-1][0] <= max_chars:
+                windows[-1][1] = max(windows[-1][1], end)
+                continue
+            
+            if len(windows) == max_snippets:
+                break
+            
+            # A window that could not be merged must not repeat the previous one's text
+            if windows:
+                start = max(start, windows[-1][1])
+                if start >= end:
+                    continue
+            windows.append([start, end])
+        
+        return [" ".join(text[start:end].split()) for start, end in windows]
 
     def extract_sensitive_info(self, text, company):
         """Use Named Entity Recognition (NER) and regex to extract sensitive information."""
@@ -277,6 +960,10 @@ class DarkWebMonitor:
         """Send an email alert when a leak is detected."""
         if not self.config.get("email_notifications", False):
             return
+        
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
             
         sender_email = self.config.get("sender_email")
         receiver_email = self.config.get("receiver_email")
@@ -305,6 +992,8 @@ class DarkWebMonitor:
         
         for leak in leak_data:
             body += f"\n- {leak['url']}\n"
+            if leak.get("changed_since"):
+                body += f"  New content since {leak['changed_since']}\n"
             if leak.get("relevant_snippets"):
                 body += "  Relevant snippets:\n"
                 for snippet in leak["relevant_snippets"]:
@@ -352,7 +1041,7 @@ class DarkWebMonitor:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"}
@@ -407,76 +1096,446 @@ class DarkWebMonitor:
         """Sanitize a string to be used as a filename."""
         return re.sub(r'[^\w\-_.]', '_', filename)
 
-    def monitor_company(self, company):
-        """Monitor dark web for leaks related to a specific company."""
-        logger.info(f"Scanning Dark Web for leaks related to {company}...")
+    def get_engine_capabilities(self, engine_url):
+        """Return the query features configured for a search engine."""
+        return self.config.get("search_engine_capabilities", {}).get(engine_url, {})
+
+    def plan_search_queries(self, companies):
+        """Collapse the engine x term x company search grid into fewer queries.
         
-        all_search_urls = []
+        Terms are merged into OR groups on engines that support them, and
+        companies that share a name or alias are searched once under that
+        shared name. Returns a list of query dicts with the engine, the term
+        expression, the searched name and the companies it serves.
+        """
+        # Search each company under the name/alias it shares with the most other
+        # companies, so companies with a common alias share one set of queries
+        names_by_company = {}
+        for company in companies:
+            entry = self.watchlist.get(company) or {"aliases": []}
+            names_by_company[company] = [company] + entry["aliases"]
+        term_counts = Counter(
+            term for names in names_by_company.values() for term in {name.lower() for name in names}
+        )
+        groups = {}
+        for company, names in names_by_company.items():
+            best = max(names, key=lambda name: (term_counts[name.lower()], name == company))
+            group = groups.setdefault(best.lower(), {"name": best, "companies": []})
+            group["companies"].append(company)
+        unique_groups = list(groups.values())
         
-        # Search through configured search engines
+        terms = self.config["search_terms"]
+        plan = []
         for engine in self.config["search_engines"]:
-            for term in self.config["search_terms"]:
-                urls = self.search_for_leaks(engine, term, company)
-                all_search_urls.extend(urls)
+            capabilities = self.get_engine_capabilities(engine)
+            operator = capabilities.get("or_operator")
+            batch_size = max(1, capabilities.get("max_terms", 1)) if operator else 1
+            for i in range(0, len(terms), batch_size):
+                batch = terms[i:i + batch_size]
+                if len(batch) == 1:
+                    expression = batch[0]
+                else:
+                    quoted = [f'"{term}"' if " " in term else term for term in batch]
+                    expression = "(" + f" {operator} ".join(quoted) + ")"
+                for group in unique_groups:
+                    plan.append({
+                        "engine": engine,
+                        "keyword": expression,
+                        "name": group["name"],
+                        "companies": group["companies"],
+                        "max_pages": capabilities.get("max_pages", 1) if capabilities.get("page_param") else 1
+                    })
+        return plan
+
+    def run_search_plan(self, plan, companies):
+        """Execute a query plan and return ({company: [urls]}, stats).
+        
+        Result pages are followed only while they keep producing new unique
+        URLs. The stats compare executed requests with the naive
+        engines x terms x companies grid.
+        """
+        urls_by_company = {company: set() for company in companies}
+        executed = 0
+        for query in plan:
+            seen = set()
+            for page in range(1, query["max_pages"] + 1):
+                if self.is_stopping():
+                    break
+                
+                urls = self.search_for_leaks(query["engine"], query["keyword"], query["name"], page=page)
+                executed += 1
+                new_urls = set(urls) - seen
+                seen.update(new_urls)
+                self.progress.emit("search_done", engine=query["engine"], term=query["keyword"],
+                                   company=query["name"], page=page, urls=len(new_urls))
                 
                 # Add a small delay to avoid overloading search engines
-                time.sleep(1)
+                self._stop_event.wait(1)
+                if not new_urls:
+                    break
+            for company in query["companies"]:
+                urls_by_company[company].update(seen)
         
-        # Add known dark web sites
-        all_search_urls.extend(self.config["dark_web_sites"])
+        naive = len(self.config["search_engines"]) * len(self.config["search_terms"]) * len(companies)
+        stats = {"planned": len(plan), "executed": executed, "naive": naive,
+                 "saved": max(0, naive - executed)}
+        logger.info(
+            f"Search plan: {executed} queries instead of {naive} "
+            f"({stats['saved']} saved) for {len(companies)} companies"
+        )
+        self.progress.emit("search_plan_done", **stats)
+        return {company: sorted(urls) for company, urls in urls_by_company.items()}, stats
+
+    def scan_urls(self, urls_by_company):
+        """Fetch every URL once and collect the leaks found for each company.
+        
+        urls_by_company maps each company to the URLs to check for it; a URL
+        shared by several companies is fetched and matched once on behalf of
+        all of them. Queued fetches are cancelled and in-flight ones are not
+        waited for after request_stop(). Returns {company: [leak, ...]}.
+        """
+        companies_by_url = {}
+        for company, urls in urls_by_company.items():
+            for url in urls:
+                companies = companies_by_url.setdefault(url, [])
+                if company not in companies:
+                    companies.append(company)
         
-        # Remove duplicates
-        all_search_urls = list(set(all_search_urls))
-        logger.info(f"Found {len(all_search_urls)} unique URLs to check")
+        companies = list(urls_by_company)
+        watchlist = self.get_watchlist_for(companies)
+        generation = self._page_state_generation
+        label = companies[0] if len(companies) == 1 else f"{len(companies)} companies"
+        logger.info(f"Found {len(companies_by_url)} unique URLs to check")
+        self.progress.emit("fetch_started", company=label, total=len(companies_by_url))
         
         # Scrape URLs for leaks using parallel processing
-        leaked_data = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config["max_concurrent_requests"]) as executor:
+        leaked_data = {company: [] for company in companies}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.config["max_concurrent_requests"])
+        try:
             future_to_url = {
-                executor.submit(self.scrape_site_for_leaks, url, company): url 
-                for url in all_search_urls
+                executor.submit(self.scrape_site_for_leaks, url, url_companies, watchlist, generation): url 
+                for url, url_companies in companies_by_url.items()
             }
             
-            for future in tqdm(concurrent.futures.as_completed(future_to_url), 
-                              total=len(all_search_urls),
-                              desc=f"Scanning for {company}"):
+            for future in concurrent.futures.as_completed(future_to_url):
                 url = future_to_url[future]
                 try:
-                    result = future.result()
-                    if result:
-                        leaked_data.append(result)
+                    for company, leak in future.result().items():
+                        leaked_data[company].append(leak)
+                        self.progress.emit("hit", company=company, url=url)
                 except Exception as e:
                     logger.error(f"Error processing {url}: {e}")
+                    self.progress.emit("error", url=url, error=str(e))
+                self.progress.emit("url_done", url=url)
+                
+                if self.is_stopping():
+                    break
+        finally:
+            # Don't wait for in-flight fetches on cancellation; they bail out on their own
+            executor.shutdown(wait=not self.is_stopping(), cancel_futures=True)
         
-        # Extract information from the first few leaks
-        if leaked_data:
-            logger.warning(f"⚠️ POTENTIAL LEAK DETECTED! Found {len(leaked_data)} potential leaks for {company}")
-            
-            # Concatenate relevant snippets for analysis
-            all_text = ""
-            for leak in leaked_data[:5]:  # Analyze only first 5 leaks
-                if leak.get("relevant_snippets"):
-                    all_text += " ".join(leak["relevant_snippets"])
-            
-            # Extract sensitive information
-            extracted_info = self.extract_sensitive_info(all_text, company)
+        return leaked_data
+
+    def report_company_leaks(self, company, leaked_data):
+        """Analyse, alert on and save a company's new leaks, then commit its page state.
+        
+        Returns True if leaks were reported.
+        """
+        if not leaked_data:
+            logger.info(f"No new leaks found for {company}")
+            self.commit_page_state(company)
+            self.progress.emit("company_done", company=company, leaks=0)
+            return False
+        
+        logger.warning(f"⚠️ POTENTIAL LEAK DETECTED! Found {len(leaked_data)} potential leaks for {company}")
+        
+        # Concatenate relevant snippets for analysis
+        all_text = ""
+        for leak in leaked_data[:5]:  # Analyze only first 5 leaks
+            # Credential dumps are already structured; keep them out of NER
+            if leak.get("relevant_snippets") and not leak.get("dump_stats"):
+                all_text += " ".join(leak["relevant_snippets"])
+        
+        # Extract sensitive information
+        extracted_info = self.extract_sensitive_info(all_text, company)
+        if self.is_stopping():
+            return self.cancel_scan(company)
+        
+        # Add extracted info to first leak item (for notifications)
+        leaked_data[0]["extracted_info"] = extracted_info
+        
+        # Send notifications
+        self.send_email_alert(company, leaked_data)
+        self.send_webhook_notification(company, leaked_data)
+        
+        # Save data
+        self.save_leak_data(company, leaked_data)
+        self.commit_page_state(company)
+        
+        self.progress.emit("company_done", company=company, leaks=len(leaked_data))
+        return True
+
+    def monitor_company(self, company):
+        """Monitor dark web for leaks related to a specific company.
+        
+        The scan stops cooperatively after request_stop(): between searches,
+        between fetched chunks and before analysis. Progress is reported
+        through self.progress. A new scan is refused (returns False) while
+        another scan or a monitoring cycle is running, since they share the
+        stop event and the progress counters.
+        """
+        if not self._scan_lock.acquire(blocking=False):
+            logger.warning(f"Not scanning {company}: another scan is already running")
+            return False
+        self._stop_event.clear()
+        self.progress.reset()
+        self.start_page_state_generation()
+        try:
+            self.progress.emit("company_started", company=company)
+            logger.info(f"Scanning Dark Web for leaks related to {company}...")
             
-            # Add extracted info to first leak item (for notifications)
-            if leaked_data:
-                leaked_data[0]["extracted_info"] = extracted_info
+            # Search through configured search engines
+            search_results, _ = self.run_search_plan(self.plan_search_queries([company]), [company])
+            if self.is_stopping():
+                return self.cancel_scan(company)
             
-            # Send notifications
-            self.send_email_alert(company, leaked_data)
-            self.send_webhook_notification(company, leaked_data)
+            # Add known dark web sites
+            leaked_data = self.scan_urls({company: search_results[company] + self.config["dark_web_sites"]})[company]
+            if self.is_stopping():
+                return self.cancel_scan(company)
             
-            # Save data
-            self.save_leak_data(company, leaked_data)
+            found_leak = self.report_company_leaks(company, leaked_data)
+            if not self.is_stopping():
+                self.progress.emit("cycle_done")
+            return found_leak
+        finally:
+            self.save_page_state()
+            self._scan_lock.release()
+
+    def cancel_scan(self, company):
+        """Record that a scan was cancelled and report no leak."""
+        logger.info(f"Scan for {company} cancelled")
+        self.discard_page_state(company)
+        self.progress.emit("cancelled", company=company)
+        return False
             
-            return True
-        else:
-            logger.info(f"No leaks found for {company}")
+    def add_company(self, name, aliases=None, domains=None, negative_keywords=None):
+        """Add a company to the watchlist and the in-memory configuration."""
+        entry = self.watchlist.add(name, aliases, domains, negative_keywords)
+        self.config["companies_to_monitor"] = self.watchlist.to_config()
+        logger.info(f"Watching {name}")
+        return entry
+
+    def remove_company(self, name):
+        """Remove a company from the watchlist and the in-memory configuration."""
+        removed = self.watchlist.remove(name)
+        if removed:
+            self.config["companies_to_monitor"] = self.watchlist.to_config()
+            logger.info(f"Stopped watching {name}")
+        return removed
+
+    def save_config(self, config_path=None, keys=None):
+        """Write the configuration back to disk.
+        
+        With keys, only those settings are updated in the existing file so
+        defaults the user never set are not copied into it. The file is
+        replaced atomically.
+        """
+        config_path = config_path or self.config_path
+        data = self.config
+        if keys is not None:
+            data = {}
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    data = json.load(f)
+            for key in keys:
+                data[key] = self.config[key]
+        
+        tmp_path = f"{config_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, config_path)
+        self._config_mtime = os.path.getmtime(config_path)
+
+    def update_config(self, changes, save=True):
+        """Apply setting changes in place and persist just those keys."""
+        self.apply_config(dict(self.config, **changes))
+        if save:
+            self.save_config(keys=list(changes))
+
+    def reload_config(self, config_path=None):
+        """Re-read the configuration file and apply only what changed.
+        
+        Models, the HTTP session and caches are kept; the watchlist is synced,
+        the Tor proxy is reconfigured only if its address changed and the
+        session is recreated only if the pool size changed. Returns the names
+        of the changed settings, or None if the file cannot be read, in which
+        case the current configuration and config path are kept.
+        """
+        config_path = config_path or self.config_path
+        new_config = self.load_config(config_path, strict=True)
+        if new_config is None:
+            logger.warning(f"Keeping the current configuration; {config_path} could not be loaded")
+            return None
+        self.config_path = config_path
+        return self.apply_config(new_config)
+
+    def apply_config(self, new_config):
+        """Diff a full configuration against the current one and apply it."""
+        changed = sorted(key for key in set(self.config) | set(new_config)
+                         if self.config.get(key) != new_config.get(key))
+        if not changed:
+            return changed
+        
+        # Swap the dict rather than mutating it so running scans never see a partial config
+        self.config = dict(new_config)
+        
+        if "companies_to_monitor" in changed:
+            added, removed = self.watchlist.sync(self.config.get("companies_to_monitor", []))
+            logger.info(f"Watchlist updated: {len(added)} added, {len(removed)} removed")
+        if self._connected and ("tor_proxy_host" in changed or "tor_proxy_port" in changed):
+            with self._tor_lock:
+                self._tor_status = {"working": None, "checked_at": None}
+            self.setup_tor()
+        if "max_concurrent_requests" in changed and self._session is not None:
+            with self._resource_lock:
+                old_session, self._session = self._session, None
+            old_session.close()
+        
+        logger.info(f"Configuration updated: {', '.join(changed)}")
+        return changed
+
+    def config_file_changed(self):
+        """Return True if the config file was modified since it was last read or written."""
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except (OSError, TypeError):
             return False
-            
+        return mtime != self._config_mtime
+
+    def load_page_state(self):
+        """Load the change-detection state from disk.
+        
+        "pages" maps each URL to the block hashes of every page version that
+        some company last analysed ({content_hash: block_hashes}); "companies"
+        holds a small per-company marker naming that version.
+        """
+        state_file = os.path.join("data", "page_state.json")
+        state = {}
+        if os.path.exists(state_file):
+            try:
+                with open(state_file, "r") as f:
+                    state = json.load(f)
+            except Exception:
+                state = {}
+        pages = {
+            # Files written with a single version per URL
+            url: {versions["content_hash"]: versions["block_hashes"]} if "block_hashes" in versions else versions
+            for url, versions in state.get("pages", {}).items()
+        }
+        return {"pages": pages, "companies": state.get("companies", {})}
+
+    def save_page_state(self):
+        """Save the change-detection state to disk if it changed.
+        
+        Called once per scan or cycle. Page versions no company refers to any
+        more are pruned first, and the file is replaced atomically so a crash
+        mid-write cannot leave a torn file that would re-alert everything.
+        """
+        state_file = os.path.join("data", "page_state.json")
+        try:
+            with self._page_state_lock:
+                if not self._page_state_dirty:
+                    return
+                referenced = {}
+                for markers in self._page_state["companies"].values():
+                    for url, marker in markers.items():
+                        referenced.setdefault(url, set()).add(marker["content_hash"])
+                pages = self._page_state["pages"]
+                for url in list(pages):
+                    versions = {content_hash: block_hashes for content_hash, block_hashes in pages[url].items()
+                                if content_hash in referenced.get(url, ())}
+                    if versions:
+                        pages[url] = versions
+                    else:
+                        del pages[url]
+                data = json.dumps(self._page_state)
+                self._page_state_dirty = False
+            tmp_file = f"{state_file}.tmp"
+            with open(tmp_file, "w") as f:
+                f.write(data)
+            os.replace(tmp_file, state_file)
+        except Exception as e:
+            logger.error(f"Error saving page state: {e}")
+
+    def get_page_state(self, company, url):
+        """Return what was last analysed for a URL on behalf of a company, or None.
+        
+        The block hashes of the page version the company analysed are
+        included, so it only looks at what is new to it even if other
+        companies have seen newer versions since.
+        """
+        with self._page_state_lock:
+            if self._page_state is None:
+                self._page_state = self.load_page_state()
+            marker = self._page_state["companies"].get(company, {}).get(url)
+            if marker is None:
+                return None
+            block_hashes = self._page_state["pages"].get(url, {}).get(marker["content_hash"])
+            if block_hashes is not None:
+                return dict(marker, block_hashes=block_hashes)
+            return marker
+
+    def start_page_state_generation(self):
+        """Start staging page state for a new scan and return its generation.
+        
+        Anything still staged by an earlier (cancelled) scan is dropped.
+        """
+        with self._page_state_lock:
+            self._page_state_generation += 1
+            self._pending_page_state = {}
+            self._pending_pages = {}
+            return self._page_state_generation
+
+    def set_pending_page_state(self, company, url, state, generation=None):
+        """Stage a URL's new state; it is committed once the scan's alerts went out.
+        
+        Block hashes are staged once per URL and version, the rest as the
+        company's marker.
+        Writes from workers of an earlier scan generation are ignored.
+        """
+        with self._page_state_lock:
+            if generation is not None and generation != self._page_state_generation:
+                return
+            state = dict(state)
+            block_hashes = state.pop("block_hashes", None)
+            if block_hashes is not None:
+                self._pending_pages.setdefault(url, {})[state["content_hash"]] = block_hashes
+            self._pending_page_state.setdefault(company, {})[url] = state
+
+    def commit_page_state(self, company):
+        """Make the staged page state of a finished scan permanent (in memory).
+        
+        save_page_state() writes it to disk at the end of the scan or cycle.
+        """
+        with self._page_state_lock:
+            pending = self._pending_page_state.pop(company, {})
+            if not pending:
+                return
+            if self._page_state is None:
+                self._page_state = self.load_page_state()
+            self._page_state["companies"].setdefault(company, {}).update(pending)
+            for url, marker in pending.items():
+                block_hashes = self._pending_pages.get(url, {}).get(marker["content_hash"])
+                if block_hashes is not None:
+                    self._page_state["pages"].setdefault(url, {})[marker["content_hash"]] = block_hashes
+            self._page_state_dirty = True
+
+    def discard_page_state(self, company):
+        """Drop the staged page state of a cancelled scan so nothing is missed next time."""
+        with self._page_state_lock:
+            self._pending_page_state.pop(company, None)
+
     def load_scan_history(self):
         """Load scan history from disk."""
         history_file = os.path.join("data", "scan_history.json")
@@ -498,52 +1557,509 @@ class DarkWebMonitor:
             logger.error(f"Error saving scan history: {e}")
     
     def run_monitoring(self):
-        """Run monitoring for all configured companies."""
-        companies = self.config.get("companies_to_monitor", [])
-        if not companies:
-            logger.warning("No companies configured for monitoring")
-            return
-            
-        logger.info(f"Starting monitoring cycle for {len(companies)} companies")
-        
-        # Load scan history
-        scan_history = self.load_scan_history()
+        """Run monitoring for all configured companies.
         
-        for company in companies:
-            # Check if we've found leaks for this company recently
-            last_found = scan_history.get(company, {}).get("last_leak_found")
-            if last_found:
-                last_found_time = datetime.fromisoformat(last_found)
-                hours_since_last = (datetime.now() - last_found_time).total_seconds() / 3600
+        The cycle is skipped if another scan (such as a test scan started from
+        the GUI) is still running.
+        """
+        if not self._scan_lock.acquire(blocking=False):
+            logger.warning("Skipping monitoring cycle: another scan is already running")
+            return
+        try:
+            companies = self.watchlist.names()
+            if not companies:
+                logger.warning("No companies configured for monitoring")
+                return
                 
-                # If we found a leak in the last 6 hours, skip this company
-                if hours_since_last < 6:
-                    logger.info(f"Skipping {company} - leak found {hours_since_last:.1f} hours ago")
-                    continue
+            logger.info(f"Starting monitoring cycle for {len(companies)} companies")
+            self._stop_event.clear()
+            self.progress.reset()
+            self.start_page_state_generation()
+            self.progress.emit("cycle_started", companies=len(companies))
+            
+            # Refresh the cached Tor health status without waiting for it
+            self.check_tor_connection()
+            
+            # Load scan history
+            scan_history = self.load_scan_history()
+            
+            companies_to_scan = []
+            for company in companies:
+                # Check if we've found leaks for this company recently
+                last_found = scan_history.get(company, {}).get("last_leak_found")
+                if last_found:
+                    last_found_time = datetime.fromisoformat(last_found)
+                    hours_since_last = (datetime.now() - last_found_time).total_seconds() / 3600
+                    
+                    # If we found a leak in the last 6 hours, skip this company
+                    if hours_since_last < 6:
+                        logger.info(f"Skipping {company} - leak found {hours_since_last:.1f} hours ago")
+                        continue
+                companies_to_scan.append(company)
+            
+            # Search once for all companies so queries can be shared between them
+            search_results, _ = self.run_search_plan(
+                self.plan_search_queries(companies_to_scan), companies_to_scan
+            )
             
-            # Run monitoring for this company
-            scan_start = datetime.now()
-            found_leak = self.monitor_company(company)
-            scan_end = datetime.now()
+            # Fetch each URL once for every company that needs it
+            leaks_by_company = {}
+            if companies_to_scan and not self.is_stopping():
+                leaks_by_company = self.scan_urls({
+                    company: search_results[company] + self.config["dark_web_sites"]
+                    for company in companies_to_scan
+                })
             
-            # Update scan history
-            if company not in scan_history:
-                scan_history[company] = {}
+            for company in companies_to_scan:
+                if self.is_stopping():
+                    break
                 
-            scan_history[company]["last_scan"] = scan_end.isoformat()
-            scan_history[company]["scan_count"] = scan_history[company].get("scan_count", 0) + 1
+                # Alert on this company's leaks
+                self.progress.emit("company_started", company=company)
+                found_leak = self.report_company_leaks(company, leaks_by_company[company])
+                scan_end = datetime.now()
+                if self.is_stopping():
+                    break
+                
+                # Update scan history
+                if company not in scan_history:
+                    scan_history[company] = {}
+                    
+                scan_history[company]["last_scan"] = scan_end.isoformat()
+                scan_history[company]["scan_count"] = scan_history[company].get("scan_count", 0) + 1
+                
+                if found_leak:
+                    scan_history[company]["last_leak_found"] = scan_end.isoformat()
+                    scan_history[company]["total_leaks_found"] = scan_history[company].get("total_leaks_found", 0) + 1
+                    
+                # Save scan history
+                self.save_scan_history(scan_history)
             
-            if found_leak:
-                scan_history[company]["last_leak_found"] = scan_end.isoformat()
-                scan_history[company]["total_leaks_found"] = scan_history[company].get("total_leaks_found", 0) + 1
+            if self.is_stopping():
+                for company in companies_to_scan:
+                    self.discard_page_state(company)
+                logger.info("Monitoring cycle cancelled")
+                self.progress.emit("cancelled")
+                return
                 
-            # Save scan history
-            self.save_scan_history(scan_history)
+            logger.info(f"Monitoring cycle completed for {len(companies)} companies")
+            self.progress.emit("cycle_done")
+        finally:
+            # Write the state of every company that finished once per cycle
+            self.save_page_state()
+            self._scan_lock.release()
+
+
+def split_content_blocks(text, max_chars=PAGE_BLOCK_MAX_CHARS):
+    """Split text into content-defined blocks for change detection.
+    
+    A block ends after a line whose checksum hits a boundary, or once it
+    reaches max_chars, so inserting text only changes the blocks around the
+    insertion. Overlong lines (minified pages) are cut into fixed-size pieces.
+    Returns (start, end) offsets.
+    """
+    blocks = []
+    block_start = 0
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        pieces = [line] if len(line) <= max_chars else [
+            line[i:i + max_chars] for i in range(0, len(line), max_chars)
+        ]
+        for piece in pieces:
+            pos += len(piece)
+            if pos - block_start >= max_chars or zlib.crc32(piece.encode(errors="replace")) % 8 == 0:
+                blocks.append((block_start, pos))
+                block_start = pos
+    if block_start < len(text):
+        blocks.append((block_start, len(text)))
+    return blocks
+
+
+def merge_adjacent_blocks(blocks):
+    """Merge (start, end) blocks that touch into contiguous regions."""
+    merged = []
+    for start, end in blocks:
+        if merged and merged[-1][1] == start:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def sniff_dump_format(sample):
+    """Guess whether a page is a combo list, CSV or SQL dump from its first chunk.
+    
+    Returns "combo", "csv", "sql" or None for regular pages.
+    """
+    if not sample or "<html" in sample[:1024].lower():
+        return None
+    
+    if len(SQL_INSERT_PATTERN.findall(sample)) >= 2 and EMAIL_DOMAIN_PATTERN.search(sample):
+        return "sql"
+    
+    lines = [line for line in sample.splitlines()[:200] if line.strip()]
+    if len(lines) < 10:
+        return None
+    
+    if len(COMBO_LINE_PATTERN.findall("\n".join(lines))) >= len(lines) * 0.8:
+        return "combo"
+    
+    comma_counts = [line.count(",") for line in lines]
+    if (comma_counts[0] > 0 and comma_counts.count(comma_counts[0]) >= len(lines) * 0.8
+            and sniff_email_column(sample) is not None):
+        return "csv"
+    
+    return None
+
+
+def sniff_email_column(sample):
+    """Return the index of the CSV column that holds email addresses, or None.
+    
+    The column must hold an email on at least half of the sampled lines.
+    """
+    lines = [line for line in sample.splitlines()[:200] if line.strip()]
+    counts = Counter(
+        column for line in lines
+        for column, field in enumerate(line.split(","))
+        if EMAIL_FIELD_PATTERN.fullmatch(field.strip().strip('"'))
+    )
+    if not counts:
+        return None
+    column, count = counts.most_common(1)[0]
+    return column if count >= len(lines) * 0.5 else None
+
+
+def scan_credential_dump(chunks, dump_format, watchlist, companies, sample_size=10):
+    """Stream a credential dump and count records per company email domain.
+    
+    Chunks are raw bytes and are only split on record boundaries (lines, or
+    SQL rows); the carried-over tail is capped so newline-free input stays
+    linear. Combo and CSV lines are matched in one pass that only reads the
+    account field (the start of the line, or the email column found by
+    sniff_email_column()); SQL rows get one pass per company that counts a
+    row at most once. Domains are tallied with a Counter, so the watchlist's
+    domain index is only consulted for the handful of unique domains in a
+    block. Returns
+    aggregate statistics plus a bounded sample of matching account names
+    (passwords are never kept).
+    """
+    stats = {
+        "format": dump_format,
+        "bytes_scanned": 0,
+        "total_records": 0,
+        "companies": {
+            company: {"matched_records": 0, "matched_domains": Counter(), "sample": []}
+            for company in companies
+        }
+    }
+    record_passes = None
+    separators = DUMP_RECORD_SEPARATORS[dump_format]
+    content_hash = hashlib.md5()
+    domain_cache = {}
+    remainder = b""
+    
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            block, remainder = remainder, b""
+        else:
+            content_hash.update(chunk)
+            stats["bytes_scanned"] += len(chunk)
             
-            # Pause between companies to avoid overwhelming Tor network
-            time.sleep(5)
+            # Only parse whole records; carry the (bounded) tail over to the next chunk
+            cut = max(
+                (position + len(separator) for separator in separators
+                 for position in [chunk.rfind(separator)] if position >= 0),
+                default=0
+            )
+            if not cut:
+                if len(remainder) + len(chunk) <= DUMP_MAX_CARRY:
+                    remainder += chunk
+                    continue
+                cut = len(chunk)
+            block, remainder = remainder + chunk[:cut], chunk[cut:]
+        if not block:
+            continue
+        
+        # (pattern, companies) passes over each block
+        if record_passes is None:
+            if dump_format == "sql":
+                record_passes = [
+                    (pattern, {company}) for company in companies
+                    for pattern in [_compile_domain_pattern(watchlist, company)] if pattern is not None
+                ]
+            elif dump_format == "csv":
+                email_column = sniff_email_column(block[:DUMP_SNIFF_BYTES].decode("utf-8", errors="replace"))
+                record_passes = [] if email_column is None else [
+                    (re.compile(DUMP_ACCOUNT_PATTERNS["csv"] % email_column), set(companies))
+                ]
+            else:
+                record_passes = [(re.compile(DUMP_ACCOUNT_PATTERNS[dump_format]), set(companies))]
+        
+        # Patterns run on the lowercased block behind a newline, so the first line
+        # is anchored like the others; offsets are one past those in block
+        lowered = b"\n" + block.lower()
+        if dump_format == "sql":
+            stats["total_records"] += block.count(b"),(") + len(DUMP_INSERT_PATTERN.findall(lowered))
+        else:
+            stats["total_records"] += block.count(b"\n") + (not block.endswith(b"\n"))
+        
+        for record_pattern, pass_companies in record_passes:
+            matched = set()
+            for domain, count in Counter(record_pattern.findall(lowered)).items():
+                if domain not in domain_cache:
+                    name = domain.decode("ascii")
+                    domain_cache[domain] = (name, watchlist.companies_for_domain(name))
+                name, domain_companies = domain_cache[domain]
+                for company in domain_companies & pass_companies:
+                    matched.add(company)
+                    company_stats = stats["companies"][company]
+                    company_stats["matched_records"] += count
+                    company_stats["matched_domains"][name] += count
             
-        logger.info(f"Monitoring cycle completed for {len(companies)} companies")
+            # Fill the samples from this block only while some company still needs them
+            sampling = {company for company in matched if len(stats["companies"][company]["sample"]) < sample_size}
+            if not sampling:
+                continue
+            for match in record_pattern.finditer(lowered):
+                needing = domain_cache[match.group(1)][1] & sampling
+                if not needing:
+                    continue
+                at = match.start(1) - 2
+                local_part = DUMP_LOCAL_PART_PATTERN.search(block, max(0, at - 64), at)
+                email = ((local_part.group(0) if local_part else b"") + b"@" + match.group(1)).decode("ascii")
+                for company in needing:
+                    sample = stats["companies"][company]["sample"]
+                    sample.append(email)
+                    if len(sample) >= sample_size:
+                        sampling.discard(company)
+                if not sampling:
+                    break
+    
+    stats["content_hash"] = content_hash.hexdigest()
+    for company_stats in stats["companies"].values():
+        company_stats["matched_domains"] = dict(company_stats["matched_domains"].most_common())
+    return stats
+
+
+class ProgressRenderer:
+    """Render a monitor's progress event stream as tqdm bars on the console."""
+
+    def __init__(self, progress, interval=0.2):
+        self.progress = progress
+        self.interval = interval
+        self._bar = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress-renderer", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Render any remaining events and close the current bar."""
+        self._done.set()
+        self._thread.join()
+        self._close_bar()
+
+    def _run(self):
+        while not self._done.is_set():
+            self._render(self.progress.drain())
+            self._done.wait(self.interval)
+        self._render(self.progress.drain())
+
+    def _render(self, events):
+        from tqdm import tqdm
+        
+        for event in events:
+            event_type = event["type"]
+            if event_type == "fetch_started":
+                self._close_bar()
+                self._bar = tqdm(total=event["total"], desc=f"Scanning for {event['company']}")
+            elif event_type == "url_done" and self._bar is not None:
+                self._bar.update(1)
+            elif event_type in ("company_done", "cancelled"):
+                self._close_bar()
+        
+        if self._bar is not None and events:
+            snapshot = self.progress.snapshot()
+            self._bar.set_postfix(hits=snapshot["hits"], errors=snapshot["errors"])
+
+    def _close_bar(self):
+        if self._bar is not None:
+            self._bar.close()
+            self._bar = None
+
+
+class ScanProfiler:
+    """Attribute wall and CPU time of a scan to DarkWebMonitor methods.
+    
+    instrument() wraps the monitor's public methods and its HTTP session on
+    the instance only, so nothing is measured (and nothing costs anything)
+    unless profiling was requested. Each call records total and self time
+    per thread; wall time minus CPU time is time spent waiting, mostly on Tor.
+    write() produces a ranked text report and a folded-stack file that
+    flamegraph.pl, speedscope or inferno can render.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {}
+        self._folded = Counter()
+        self._wrapped = []
+        self._monitor = None
+
+    def instrument(self, monitor):
+        """Start profiling a monitor's methods and HTTP requests.
+        
+        Only one profiler can be active per monitor, since stacked wrappers
+        would be restored out of order. Raises RuntimeError if the monitor is
+        already being profiled.
+        """
+        import inspect
+        
+        with monitor._resource_lock:
+            if monitor._profiler is not None:
+                raise RuntimeError("This monitor is already being profiled")
+            monitor._profiler = self
+        self._monitor = monitor
+        
+        for name, member in inspect.getmembers(type(monitor), inspect.isfunction):
+            if name.startswith("_") or inspect.isgeneratorfunction(member):
+                continue
+            self._wrap(monitor, name, getattr(monitor, name), name)
+        session = monitor.session
+        self._wrap(session, "get", session.get, "http_get")
+        self._wrap(session, "post", session.post, "http_post")
+        return self
+
+    def restore(self):
+        """Remove the instrumentation again."""
+        for target, attribute, original in reversed(self._wrapped):
+            if original is None:
+                delattr(target, attribute)
+            else:
+                setattr(target, attribute, original)
+        self._wrapped = []
+        if self._monitor is not None:
+            self._monitor._profiler = None
+            self._monitor = None
+
+    def _wrap(self, target, attribute, func, label):
+        def profiled(*args, **kwargs):
+            stack = getattr(self._local, "stack", None)
+            if stack is None:
+                root = "main" if threading.current_thread() is threading.main_thread() else "worker"
+                stack = self._local.stack = [[root, 0.0, 0.0]]
+            frame = [label, 0.0, 0.0]
+            stack.append(frame)
+            start_wall, start_cpu = time.perf_counter(), time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall = time.perf_counter() - start_wall
+                cpu = time.thread_time() - start_cpu
+                stack.pop()
+                path = ";".join(entry[0] for entry in stack + [frame])
+                self._record(label, path, wall, cpu, wall - frame[1], cpu - frame[2])
+                stack[-1][1] += wall
+                stack[-1][2] += cpu
+
+        self._wrapped.append((target, attribute, vars(target).get(attribute)))
+        setattr(target, attribute, profiled)
+
+    def _record(self, label, path, wall, cpu, self_wall, self_cpu):
+        with self._lock:
+            stats = self._stats.setdefault(label, [0, 0.0, 0.0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += wall
+            stats[2] += self_wall
+            stats[3] += cpu
+            stats[4] += self_cpu
+            self._folded[path] += int(self_wall * 1e6)
+
+    def report(self, limit=None):
+        """Return the ranked text report (by total wall time)."""
+        with self._lock:
+            rows = sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+        lines = [
+            f"{'method':<32} {'calls':>7} {'wall s':>9} {'self s':>9} {'cpu s':>9} {'self cpu':>9} {'wait s':>9}",
+            "-" * 90
+        ]
+        for label, (calls, wall, self_wall, cpu, self_cpu) in rows[:limit]:
+            lines.append(
+                f"{label:<32} {calls:>7} {wall:>9.3f} {self_wall:>9.3f} "
+                f"{cpu:>9.3f} {self_cpu:>9.3f} {wall - cpu:>9.3f}"
+            )
+        return "\n".join(lines)
+
+    def write(self, prefix):
+        """Write <prefix>.txt (ranked report) and <prefix>.folded (flamegraph input)."""
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        report_file = f"{prefix}.txt"
+        with open(report_file, "w") as f:
+            f.write(self.report() + "\n")
+        
+        folded_file = f"{prefix}.folded"
+        with self._lock:
+            folded = sorted(self._folded.items())
+        with open(folded_file, "w") as f:
+            for path, microseconds in folded:
+                if microseconds > 0:
+                    f.write(f"{path} {microseconds}\n")
+        
+        logger.info(f"Profile written to {report_file} and {folded_file}")
+        return report_file, folded_file
+
+
+def default_profile_prefix():
+    """Return a timestamped profile path under reports/."""
+    return os.path.join("reports", f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+
+
+def print_profile(profiler, prefix=None):
+    """Stop profiling, write the profile files and print the top of the report."""
+    profiler.restore()
+    report_file, folded_file = profiler.write(prefix or default_profile_prefix())
+    print(profiler.report(limit=15))
+    print(f"Full report: {report_file}")
+    print(f"Flamegraph input: {folded_file}")
+
+
+_shared_monitor = None
+_shared_monitor_lock = threading.Lock()
+
+
+def get_shared_monitor(config_path="config.json", connect=True):
+    """Return the process-wide monitor engine, creating it on first use.
+    
+    The GUI and the CLI share this instance; switching to a different config
+    file reloads it in place instead of building a new monitor.
+    """
+    global _shared_monitor
+    with _shared_monitor_lock:
+        if _shared_monitor is None:
+            _shared_monitor = DarkWebMonitor(config_path, connect=connect)
+        elif config_path != _shared_monitor.config_path:
+            _shared_monitor.reload_config(config_path)
+        if connect and not _shared_monitor._connected:
+            _shared_monitor._connected = True
+            _shared_monitor.setup_tor()
+        return _shared_monitor
+
+
+def format_company_entry(entry):
+    """Format a watchlist entry as a single human-readable line."""
+    details = [
+        f"{label}: {', '.join(entry[key])}"
+        for key, label in (("aliases", "aliases"), ("domains", "domains"),
+                           ("negative_keywords", "excluding"))
+        if entry[key]
+    ]
+    return f"{entry['name']} ({'; '.join(details)})" if details else entry["name"]
 
 
 def create_default_config(config_path):
@@ -601,16 +2117,27 @@ def main():
     parser.add_argument("--create-config", action="store_true", help="Create a default configuration file")
     parser.add_argument("-t", "--test", help="Test monitoring for a specific company", metavar="COMPANY")
     parser.add_argument("--add-company", help="Add a company to monitor", metavar="COMPANY")
+    parser.add_argument("--alias", action="append", metavar="ALIAS",
+                        help="Alias for --add-company (repeatable)")
+    parser.add_argument("--domain", action="append", metavar="DOMAIN",
+                        help="Email domain for --add-company (repeatable)")
+    parser.add_argument("--negative-keyword", action="append", metavar="KEYWORD",
+                        help="Ignore pages mentioning this keyword for --add-company (repeatable)")
+    parser.add_argument("--remove-company", help="Stop monitoring a company", metavar="COMPANY")
     parser.add_argument("--list-companies", action="store_true", help="List companies being monitored")
     parser.add_argument("--set-email", nargs=3, metavar=("EMAIL", "PASSWORD", "RECIPIENT"), 
                         help="Set email notification settings")
     parser.add_argument("--interval", type=int, help="Set monitoring interval in minutes")
+    parser.add_argument("--profile", nargs="?", const="", metavar="PREFIX",
+                        help="Profile the scan and write PREFIX.txt / PREFIX.folded "
+                             "(default: reports/profile_<timestamp>)")
     
     args = parser.parse_args()
     
     # Create default config if requested or if it doesn't exist and no other operation specified
     if args.create_config or (not os.path.exists(args.config) and not any([
-            args.test, args.add_company, args.list_companies, args.set_email, args.interval
+            args.test, args.add_company, args.remove_company, args.list_companies,
+            args.set_email, args.interval
         ])):
         create_default_config(args.config)
         if args.create_config:
@@ -618,63 +2145,79 @@ def main():
             print("Please edit this file to add your companies and configure notifications.")
             return
     
-    # Create monitor instance
-    monitor = DarkWebMonitor(args.config)
+    # Create monitor instance; config-only commands never touch the network
+    config_only = any([
+        args.add_company, args.remove_company, args.list_companies, args.set_email, args.interval
+    ])
+    monitor = get_shared_monitor(args.config, connect=not config_only)
     
     # Handle commands
     if args.add_company:
-        if args.add_company not in monitor.config.get("companies_to_monitor", []):
-            if "companies_to_monitor" not in monitor.config:
-                monitor.config["companies_to_monitor"] = []
-            monitor.config["companies_to_monitor"].append(args.add_company)
-            
-            # Save updated config
+        monitor.add_company(args.add_company, args.alias, args.domain, args.negative_keyword)
+        
+        # Save updated config
+        try:
+            monitor.save_config(keys=["companies_to_monitor"])
+            print(f"Added {args.add_company} to monitored companies")
+        except Exception as e:
+            print(f"Error saving config: {e}")
+    
+    elif args.remove_company:
+        if monitor.remove_company(args.remove_company):
             try:
-                with open(args.config, "w") as f:
-                    json.dump(monitor.config, f, indent=2)
-                print(f"Added {args.add_company} to monitored companies")
+                monitor.save_config(keys=["companies_to_monitor"])
+                print(f"Removed {args.remove_company} from monitored companies")
             except Exception as e:
                 print(f"Error saving config: {e}")
+        else:
+            print(f"{args.remove_company} is not being monitored")
     
     elif args.list_companies:
-        companies = monitor.config.get("companies_to_monitor", [])
+        companies = monitor.watchlist.names()
         if companies:
             print("Currently monitoring these companies:")
             for i, company in enumerate(companies, 1):
-                print(f"{i}. {company}")
+                print(f"{i}. {format_company_entry(monitor.watchlist.get(company))}")
         else:
             print("No companies configured for monitoring")
     
     elif args.set_email:
-        monitor.config["email_notifications"] = True
-        monitor.config["sender_email"] = args.set_email[0]
-        monitor.config["email_password"] = args.set_email[1]
-        monitor.config["receiver_email"] = args.set_email[2]
-        
         try:
-            with open(args.config, "w") as f:
-                json.dump(monitor.config, f, indent=2)
+            monitor.update_config({
+                "email_notifications": True,
+                "sender_email": args.set_email[0],
+                "email_password": args.set_email[1],
+                "receiver_email": args.set_email[2]
+            })
             print("Email notification settings updated")
         except Exception as e:
             print(f"Error saving config: {e}")
     
     elif args.interval:
-        monitor.config["monitoring_interval_minutes"] = args.interval
         try:
-            with open(args.config, "w") as f:
-                json.dump(monitor.config, f, indent=2)
+            monitor.update_config({"monitoring_interval_minutes": args.interval})
             print(f"Monitoring interval set to {args.interval} minutes")
         except Exception as e:
             print(f"Error saving config: {e}")
     
     elif args.test:
         print(f"Running test scan for {args.test}...")
-        monitor.monitor_company(args.test)
+        profiler = ScanProfiler().instrument(monitor) if args.profile is not None else None
+        renderer = ProgressRenderer(monitor.progress).start()
+        try:
+            monitor.monitor_company(args.test)
+        except KeyboardInterrupt:
+            monitor.request_stop()
+            print("\n🛑 Test scan cancelled by user")
+        finally:
+            renderer.stop()
+            if profiler:
+                print_profile(profiler, args.profile)
     
     else:
         # Normal operation - start monitoring schedule
         interval_minutes = monitor.config.get("monitoring_interval_minutes", 30)
-        companies = monitor.config.get("companies_to_monitor", [])
+        companies = monitor.watchlist.names()
         
         if not companies:
             print("No companies configured for monitoring. Use --add-company to add companies.")
@@ -683,19 +2226,38 @@ def main():
         print(f"🚀 Dark Web Monitoring started! Running every {interval_minutes} minutes for {len(companies)} companies.")
         print("Press Ctrl+C to stop.")
         
+        import schedule
+        
+        # Instrument before scheduling so the scheduled job binds the profiled method
+        profiler = ScanProfiler().instrument(monitor) if args.profile is not None else None
+        
         # Schedule monitoring
         schedule.every(interval_minutes).minutes.do(monitor.run_monitoring)
         
-        # Run once immediately
-        monitor.run_monitoring()
+        renderer = ProgressRenderer(monitor.progress).start()
         
-        # Keep running
+        # Keep running, picking up edits to the config file without restarting
         try:
+            # Run once immediately
+            monitor.run_monitoring()
+            
             while True:
+                if monitor.config_file_changed():
+                    changed = monitor.reload_config()
+                    if changed and "monitoring_interval_minutes" in changed:
+                        interval_minutes = monitor.config.get("monitoring_interval_minutes", 30)
+                        schedule.clear()
+                        schedule.every(interval_minutes).minutes.do(monitor.run_monitoring)
+                        print(f"Monitoring interval changed to {interval_minutes} minutes")
                 schedule.run_pending()
                 time.sleep(1)
         except KeyboardInterrupt:
+            monitor.request_stop()
             print("\n🛑 Monitoring stopped by user")
+        finally:
+            renderer.stop()
+            if profiler:
+                print_profile(profiler, args.profile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""Tests for credential dump sniffing and scanning.
+
+Run with: python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from script2 import CompanyWatchlist, scan_credential_dump, sniff_dump_format, sniff_email_column
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class SniffTests(unittest.TestCase):
+    def test_combo_list(self):
+        sample = "".join(f"user{i}@example.com:pass{i}\n" for i in range(20))
+        self.assertEqual(sniff_dump_format(sample), "combo")
+
+    def test_csv_with_email_column(self):
+        sample = "id,email,password\n" + "".join(f"{i},user{i}@example.com,pass{i}\n" for i in range(20))
+        self.assertEqual(sniff_dump_format(sample), "csv")
+        self.assertEqual(sniff_email_column(sample), 1)
+
+    def test_csv_without_email_column(self):
+        sample = "id,name,city\n" + "".join(f"{i},name{i},city{i}\n" for i in range(20))
+        self.assertIsNone(sniff_dump_format(sample))
+        self.assertIsNone(sniff_email_column(sample))
+
+    def test_sql_dump(self):
+        sample = "".join(f"INSERT INTO users VALUES ({i},'user{i}@example.com','hash');\n" for i in range(3))
+        self.assertEqual(sniff_dump_format(sample), "sql")
+
+    def test_regular_pages(self):
+        self.assertIsNone(sniff_dump_format("<html><body>user@example.com:secret</body></html>"))
+        self.assertIsNone(sniff_dump_format("user@example.com:secret\n"))
+
+
+class ScanTests(unittest.TestCase):
+    def setUp(self):
+        self.watchlist = CompanyWatchlist(["Acme", {"name": "Globex", "domains": ["globex.com"]}])
+
+    def test_combo_counts_account_field_only(self):
+        data = (b"bob@gmail.com:Secret99@acme.com\n"
+                b"alice@ACME.com:x@acme.com\n"
+                b"carol@mail.acme.co.uk|pw\n")
+        stats = scan_credential_dump(split(data, 20), "combo", self.watchlist, ["Acme"])
+        acme = stats["companies"]["Acme"]
+        self.assertEqual(stats["total_records"], 3)
+        self.assertEqual(acme["matched_records"], 2)
+        self.assertEqual(acme["matched_domains"], {"acme.com": 1, "mail.acme.co.uk": 1})
+        self.assertEqual(acme["sample"], ["alice@acme.com", "carol@mail.acme.co.uk"])
+
+    def test_csv_counts_email_column_only(self):
+        data = (b"id,email,password\n"
+                b"1,bob@gmail.com,Secret99@acme.com\n"
+                b'2,"dave@acme.com",hunter2\n'
+                b"3,erin@globex.com,pw@acme.com\n")
+        stats = scan_credential_dump([data], "csv", self.watchlist, ["Acme", "Globex"])
+        self.assertEqual(stats["companies"]["Acme"]["matched_records"], 1)
+        self.assertEqual(stats["companies"]["Acme"]["sample"], ["dave@acme.com"])
+        self.assertEqual(stats["companies"]["Globex"]["sample"], ["erin@globex.com"])
+
+    def test_sql_rows_count_once_per_company(self):
+        data = (b"INSERT INTO u VALUES (1,'a@acme.com','b@acme.com'),(2,'c@x.com','d@globex.com'),"
+                b"(3,'e@acme.com','f@globex.com');\n")
+        stats = scan_credential_dump(split(data, 40), "sql", self.watchlist, ["Acme", "Globex"])
+        self.assertEqual(stats["total_records"], 3)
+        self.assertEqual(stats["companies"]["Acme"]["matched_records"], 2)
+        self.assertEqual(stats["companies"]["Globex"]["matched_records"], 2)
+
+    def test_newline_free_input_is_scanned_in_bounded_blocks(self):
+        data = b"x" * (3 * 1024 * 1024) + b"\nzed@acme.com:pw\n"
+        stats = scan_credential_dump(split(data, 256 * 1024), "combo", self.watchlist, ["Acme"])
+        self.assertEqual(stats["bytes_scanned"], len(data))
+        self.assertEqual(stats["companies"]["Acme"]["matched_records"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Tests for change detection across scans, driven through scan_urls with a fake session.
+
+Run with: python -m unittest discover tests
+"""
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from script2 import DarkWebMonitor, split_content_blocks
+
+URL = "http://leaks.onion/board"
+
+
+def filler(start, count):
+    return "".join(f"entry {i}: nothing of interest here, just padding text\n" for i in range(start, start + count))
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.status_code = 200
+        self.encoding = "utf-8"
+        self._body = body.encode()
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetches = []
+
+    def get(self, url, **kwargs):
+        self.fetches.append(url)
+        return FakeResponse(self.pages[url])
+
+
+@unittest.skipIf(importlib.util.find_spec("requests") is None, "requests is not installed")
+class PageStateTests(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.mkdtemp()
+        os.chdir(self.tmp)
+        with open("config.json", "w") as f:
+            json.dump({
+                "companies_to_monitor": ["Acme", "Globex"],
+                "search_engines": [],
+                "dark_web_sites": [URL]
+            }, f)
+        self.pages = {URL: "Acme password dump posted\nGlobex password dump posted\n" + filler(0, 300)}
+        self.monitor = self.new_monitor()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp)
+
+    def new_monitor(self):
+        monitor = DarkWebMonitor("config.json", connect=False)
+        monitor._session = FakeSession(self.pages)
+        return monitor
+
+    def scan(self, companies, monitor=None):
+        """Scan the page for the companies and commit their state like a finished cycle."""
+        monitor = monitor or self.monitor
+        monitor.start_page_state_generation()
+        leaks = monitor.scan_urls({company: [URL] for company in companies})
+        for company in companies:
+            monitor.commit_page_state(company)
+        monitor.save_page_state()
+        return {company: found for company, found in leaks.items() if found}
+
+    def test_page_is_fetched_once_for_all_companies(self):
+        leaks = self.scan(["Acme", "Globex"])
+        self.assertEqual(sorted(leaks), ["Acme", "Globex"])
+        self.assertEqual(self.monitor.session.fetches, [URL])
+
+    def test_unchanged_page_does_not_alert_again(self):
+        self.scan(["Acme", "Globex"])
+        self.assertEqual(self.scan(["Acme", "Globex"]), {})
+        # The saved state is picked up by a fresh monitor as well
+        self.assertEqual(self.scan(["Acme", "Globex"], monitor=self.new_monitor()), {})
+
+    def test_company_behind_other_companies_only_sees_its_new_regions(self):
+        self.scan(["Acme", "Globex"])
+        self.pages[URL] += filler(300, 100) + "Globex customer breach\n"
+        self.assertEqual(list(self.scan(["Globex"])), ["Globex"])
+        self.pages[URL] += filler(400, 50) + "Acme credentials leaked again\n"
+
+        leak = self.scan(["Acme"])["Acme"][0]
+        snippets = " ".join(leak["relevant_snippets"])
+        self.assertIn("Acme credentials leaked again", snippets)
+        self.assertNotIn("Acme password dump posted", snippets)
+        # Only the blocks added since Acme's scan, not the whole page again
+        self.assertLess(leak["new_regions"], len(split_content_blocks(self.pages[URL])) // 2)
+
+    def test_unreferenced_page_versions_are_pruned(self):
+        self.scan(["Acme", "Globex"])
+        self.pages[URL] += "Globex customer breach\n"
+        self.scan(["Globex"])
+        self.assertEqual(len(self.monitor._page_state["pages"][URL]), 2)
+        self.scan(["Acme"])
+        self.assertEqual(len(self.monitor._page_state["pages"][URL]), 1)
+
+    def test_discarded_state_alerts_again(self):
+        self.monitor.start_page_state_generation()
+        self.assertIn("Acme", self.monitor.scan_urls({"Acme": [URL]}))
+        self.monitor.discard_page_state("Acme")
+        self.monitor.save_page_state()
+        self.assertIsNone(self.monitor.get_page_state("Acme", URL))
+        self.assertIn("Acme", self.scan(["Acme"]))
+
+    def test_writes_from_an_earlier_generation_are_dropped(self):
+        stale = self.monitor.start_page_state_generation()
+        self.monitor.start_page_state_generation()
+        self.monitor.scrape_site_for_leaks(URL, ["Acme"], generation=stale)
+        self.monitor.commit_page_state("Acme")
+        self.assertIsNone(self.monitor.get_page_state("Acme", URL))
+
+    def test_cancelled_scan_commits_nothing(self):
+        def stop_during_analysis(text, company):
+            self.monitor.request_stop()
+            return {}
+        self.monitor.extract_sensitive_info = stop_during_analysis
+
+        self.assertFalse(self.monitor.monitor_company("Acme"))
+        self.assertIsNone(self.monitor.get_page_state("Acme", URL))
+        self.assertFalse(os.path.exists(os.path.join("data", "page_state.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for CompanyWatchlist matching.
+
+Run with: python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from script2 import CompanyWatchlist
+
+
+class NestedNameTests(unittest.TestCase):
+    def test_prefix_name_matches_alongside_longer_name(self):
+        watchlist = CompanyWatchlist(["Acme", "Acme Corp"])
+        matches = watchlist.match("Acme Corp password dump")
+        self.assertEqual(matches, {"Acme Corp": [(0, 9)], "Acme": [(0, 4)]})
+
+    def test_alias_nested_in_another_company_name(self):
+        watchlist = CompanyWatchlist([
+            "Globex Bank Ltd",
+            {"name": "Globex", "aliases": ["Globex Bank"]},
+            "Bank Ltd"
+        ])
+        matches = watchlist.match("leak at globex bank ltd today")
+        self.assertEqual(matches["Globex Bank Ltd"], [(8, 23)])
+        self.assertEqual(matches["Globex"], [(8, 19)])
+        self.assertEqual(matches["Bank Ltd"], [(15, 23)])
+
+    def test_nested_name_needs_word_boundary(self):
+        watchlist = CompanyWatchlist(["Acme", "Acmecorp"])
+        self.assertEqual(watchlist.match("acmecorp leak"), {"Acmecorp": [(0, 8)]})
+
+    def test_negative_keyword_only_drops_its_company(self):
+        watchlist = CompanyWatchlist([
+            "Acme",
+            {"name": "Acme Corp", "negative_keywords": ["acme corp fan club"]}
+        ])
+        self.assertEqual(watchlist.match("Acme Corp fan club"), {"Acme": [(0, 4)]})
+
+
+if __name__ == "__main__":
+    unittest.main()